@@ -1,5 +1,5 @@
 import aerosandbox.numpy as np
-from aerosandbox.optimization.opti import Opti
+from aerosandbox.optimization.opti import Opti, _get_attribute_items
 from abc import abstractmethod, ABC
 import copy
 from typing import Dict, Any
@@ -100,11 +100,11 @@ class AeroSandboxObject(ABC):
                 if issubclass(t, type_to_skip):
                     return item
 
-            # If it's any other type, try converting its attribute dictionary:
+            # If it's any other type, try converting its attributes (including any stored in __slots__):
             try:
                 newdict = {
                     k: convert(v)
-                    for k, v in item.__dict__.items()
+                    for k, v in _get_attribute_items(item).items()
                 }
 
                 if inplace:
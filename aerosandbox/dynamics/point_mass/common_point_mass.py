@@ -3,12 +3,74 @@ from aerosandbox.common import AeroSandboxObject
 from abc import ABC, abstractmethod, abstractproperty
 from typing import Union, Dict, Tuple, List
 from aerosandbox import MassProperties, Opti, OperatingPoint, Atmosphere, Airplane, _asb_root
+from aerosandbox.optimization.opti import _get_attribute_items
 from aerosandbox.tools.string_formatting import trim_string
-import inspect
-import copy
+import functools
+import weakref
+from types import MappingProxyType
+
+
+@functools.lru_cache(maxsize=None)
+def _init_args_for(cls) -> Tuple[str, ...]:
+    """
+    Returns the names of the arguments of `cls.__init__`, excluding `self`.
+
+    Memoized per-class, since `inspect.signature` is expensive and the answer never changes for a given class.
+    (The `inspect` import lives here too, so that importing this module doesn't pay for it.)
+    """
+    import inspect
+
+    return tuple(inspect.signature(cls.__init__).parameters.keys())[1:]
+
+
+_state_cache = weakref.WeakKeyDictionary()
+"""
+Maps Dynamics instances to a cached (read-only view of) their `state` dict.
+
+Kept out of instance `__dict__`s on purpose, so that code that walks or copies instance attributes (e.g.,
+`OptiSol.value`'s recursive solution substitution, or `__getitem__`'s per-attribute indexing) never sees a stale
+cache entry.
+"""
+
+
+def _cached_state_property(state_property: property) -> property:
+    """
+    Wraps a subclass's `state` property so that the dict it builds is only materialized once per instance.
+
+    The cached dict is returned as a `MappingProxyType`, so callers can't mutate the shared copy. The cache is
+    invalidated whenever any attribute of the instance is rebound (see
+    `_DynamicsPointMassBaseClass.__setattr__`); in-place mutation of an attribute's contents needs no
+    invalidation, since the cached dict holds references to the same objects.
+    """
+    fget = state_property.fget
+
+    @functools.wraps(fget)
+    def cached_fget(self):
+        try:
+            return _state_cache[self]
+        except KeyError:
+            state = MappingProxyType(fget(self))
+            _state_cache[self] = state
+            return state
+
+    return property(cached_fget)
 
 
 class _DynamicsPointMassBaseClass(AeroSandboxObject, ABC):
+    # The known state, indirect-control, and control variable names across the point-mass Dynamics family.
+    # Declaring them as slots cuts per-instance memory (the instance `__dict__` is never allocated for known
+    # attributes) and speeds up attribute access in hot loops. Attributes not listed here still work: they fall
+    # back to the instance dict, as usual.
+    __slots__ = (
+        "mass_props",
+        "x_e", "y_e", "z_e",
+        "u_e", "v_e", "w_e",
+        "speed", "gamma", "track",
+        "alpha", "beta", "bank",
+        "Fx_e", "Fy_e", "Fz_e",
+        "Fx_w", "Fy_w", "Fz_w",
+    )
+
     @abstractmethod
     def __init__(self,
                  mass_props: MassProperties = None,
@@ -23,6 +85,30 @@ class _DynamicsPointMassBaseClass(AeroSandboxObject, ABC):
         For each control variable, self.control_var = 0
         """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        ### Wrap any concrete `state` property with a per-instance cache of the dict it builds.
+        state_property = cls.__dict__.get("state")
+        if isinstance(state_property, property) and state_property.fget is not None:
+            cls.state = _cached_state_property(state_property)
+
+    def __setattr__(self, name, value):
+        _state_cache.pop(self, None)  # Rebinding any attribute may change the state; drop the cached dict.
+        object.__setattr__(self, name, value)
+
+    def __getstate__(self):
+        """
+        Support for copying and pickling: captures slot-stored and dict-stored attributes alike. (The default
+        object.__getstate__ would also capture computed properties that shadow slot names, which then can't be
+        restored.)
+        """
+        return self._attribute_items()
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
     @abstractproperty
     def state(self) -> Dict[str, Union[float, np.ndarray]]:
         """
@@ -59,9 +145,8 @@ class _DynamicsPointMassBaseClass(AeroSandboxObject, ABC):
 
         """
 
-        ### Get a list of all the inputs that the class constructor wants to see
-        init_signature = inspect.signature(self.__class__.__init__)
-        init_args = list(init_signature.parameters.keys())[1:]  # Ignore 'self'
+        ### Get a list of all the inputs that the class constructor wants to see (cached per-class; ignores 'self')
+        init_args = _init_args_for(self.__class__)
 
         ### Create a new instance, and give the constructor all the inputs it wants to see (based on values in this instance)
         new_dyn: __class__ = self.__class__(**{
@@ -96,14 +181,39 @@ class _DynamicsPointMassBaseClass(AeroSandboxObject, ABC):
         if new_state is None:
             new_state = {}
 
-        try:  # Assume `value` is a dict-like, with keys
-            for key in new_state.keys():  # Overwrite each of the specified state variables
-                setattr(self, key, new_state[key])
+        if isinstance(new_state, (dict, MappingProxyType)):  # If it's dict-like, with keys
+            for key, value in new_state.items():  # Overwrite each of the specified state variables
+                setattr(self, key, value)
 
-        except AttributeError:  # Assume it's an iterable that has been sorted.
+        else:  # Assume it's an iterable that has been sorted.
             self._set_state(
                 self.pack_state(new_state))  # Pack the iterable into a dict-like, then do the same thing as above.
 
+    def _attribute_items(self) -> Dict[str, Union[float, np.ndarray]]:
+        """
+        Returns a name-to-value dict of all attributes bound on this instance, whether stored in `__slots__` or
+        in the instance `__dict__`. Slot names that are shadowed by class-level properties, or that were never
+        assigned, are excluded — matching plain `__dict__` iteration on a slot-less class.
+
+        Delegates to the same helper that `OptiSol.value()` uses for its recursive solution substitution, so
+        the two walks can't drift apart in their slot/shadowed-property semantics.
+        """
+        return _get_attribute_items(self)
+
+    def _state_keys(self) -> Tuple[str, ...]:
+        """
+        Returns the names of the state variables of this Dynamics instance, as a tuple of strings.
+
+        Identical to `tuple(self.state.keys())`, but cached per-class, so that hot paths (e.g., packing and
+        unpacking the state on every step of an ODE integration) don't rebuild the state dict just to read its keys.
+        """
+        cls = type(self)
+        keys = cls.__dict__.get("_cached_state_keys")
+        if keys is None:
+            keys = tuple(self.state.keys())
+            cls._cached_state_keys = keys
+        return keys
+
     def unpack_state(self,
                      dict_like_state: Dict[str, Union[float, np.ndarray]] = None
                      ) -> Tuple[Union[float, np.ndarray]]:
@@ -117,7 +227,10 @@ class _DynamicsPointMassBaseClass(AeroSandboxObject, ABC):
 
         """
         if dict_like_state is None:
-            dict_like_state = self.state
+            return tuple(
+                getattr(self, k)
+                for k in self._state_keys()
+            )
         return tuple(dict_like_state.values())
 
     def pack_state(self,
@@ -134,13 +247,14 @@ class _DynamicsPointMassBaseClass(AeroSandboxObject, ABC):
         """
         if array_like_state is None:
             return self.state
-        if not len(self.state.keys()) == len(array_like_state):
+        state_keys = self._state_keys()
+        if not len(state_keys) == len(array_like_state):
             raise ValueError(
                 "There are a differing number of elements in the `state` variable and the `array_like` you're trying to pack!")
         return {
             k: v
             for k, v in zip(
-                self.state.keys(),
+                state_keys,
                 array_like_state
             )
         }
@@ -196,6 +310,10 @@ class _DynamicsPointMassBaseClass(AeroSandboxObject, ABC):
 
         """
 
+        ### If no state variables are vectorized, indexing every attribute would be a no-op; skip the whole loop.
+        if len(self) == 1:
+            return self.get_new_instance_with_state()
+
         def get_item_of_attribute(a):
             try:
                 return a[index]
@@ -208,8 +326,20 @@ class _DynamicsPointMassBaseClass(AeroSandboxObject, ABC):
 
         new_instance = self.get_new_instance_with_state()
 
-        for k, v in new_instance.__dict__.items():
-            setattr(new_instance, k, get_item_of_attribute(v))
+        for k, v in new_instance._attribute_items().items():
+            if isinstance(v, np.ndarray):
+                # Fast path for NumPy arrays (the overwhelmingly common case here): subscript directly,
+                # skipping the try/except dispatch that generic attributes need below.
+                if v.ndim > 0:
+                    if isinstance(index, int) and not (-v.shape[0] <= index < v.shape[0]):
+                        raise IndexError("A state variable could not be indexed, since the index is out of range!")
+                    setattr(new_instance, k, v[index])
+                # (0-dimensional arrays are scalar-like, and pass through unchanged.)
+            elif isinstance(v, str):
+                pass  # Subscriptable, but meant to pass through whole.
+            elif hasattr(v, "__getitem__"):
+                setattr(new_instance, k, get_item_of_attribute(v))
+            # Scalar attributes (floats, ints) pass through unchanged.
 
         return new_instance
 
@@ -219,17 +349,13 @@ class _DynamicsPointMassBaseClass(AeroSandboxObject, ABC):
 
         If no elements of the state vector are vectorized, returns 1.
         """
-        length = 1
-        for v in self.state.values():
-            if np.length(v) == 1:
-                pass
-            elif length == 1:
-                length = np.length(v)
-            elif length == np.length(v):
-                pass
-            else:
-                raise ValueError("State variables are appear vectorized, but of different lengths!")
-        return length
+        nontrivial_lengths = {
+            np.length(v)
+            for v in self.state.values()
+        } - {1}
+        if len(nontrivial_lengths) > 1:
+            raise ValueError("State variables are appear vectorized, but of different lengths!")
+        return nontrivial_lengths.pop() if nontrivial_lengths else 1
 
     @abstractmethod
     def state_derivatives(self) -> Dict[str, Union[float, np.ndarray]]:
@@ -436,15 +562,10 @@ class _DynamicsPointMassBaseClass(AeroSandboxObject, ABC):
             else:
                 raise TypeError("`vehicle_model` should be an Airplane or PolyData object.")
 
-            x_e = np.array(self.x_e)
-            y_e = np.array(self.y_e)
-            z_e = np.array(self.z_e)
-            if np.length(x_e) == 1:
-                x_e = x_e * np.ones(len(self))
-            if np.length(y_e) == 1:
-                y_e = y_e * np.ones(len(self))
-            if np.length(z_e) == 1:
-                z_e = z_e * np.ones(len(self))
+            length = len(self)
+            x_e = np.broadcast_to(np.atleast_1d(np.array(self.x_e)), (length,))
+            y_e = np.broadcast_to(np.atleast_1d(np.array(self.y_e)), (length,))
+            z_e = np.broadcast_to(np.atleast_1d(np.array(self.z_e)), (length,))
 
             if scale_vehicle_model is None:
                 trajectory_bounds = np.array([
@@ -477,83 +598,109 @@ class _DynamicsPointMassBaseClass(AeroSandboxObject, ABC):
             plotter.show_grid(color='gray')
 
             ### Draw the vehicle
+            base_points = np.array(vehicle_model.points)
+
+            # Gather the Euler angles of all frames at once, as (length,) arrays, rather than rebuilding a Dynamics
+            # instance per frame via `self[i]`.
+            try:
+                phi = self.phi
+            except AttributeError:
+                phi = self.bank
+            try:
+                theta = self.theta
+            except AttributeError:
+                theta = self.gamma
+            try:
+                psi = self.psi
+            except AttributeError:
+                psi = self.track
+
+            phis = np.broadcast_to(np.atleast_1d(np.array(phi)), (length,))
+            thetas = np.broadcast_to(np.atleast_1d(np.array(theta)), (length,))
+            psis = np.broadcast_to(np.atleast_1d(np.array(psi)), (length,))
+
+            # Batch-construct the body-to-earth rotation matrices of all frames at once, as a (length, 3, 3)
+            # array. Scipy's intrinsic 'ZYX' convention matches np.rotation_matrix_from_euler_angles, i.e.,
+            # R = R_z(psi) @ R_y(theta) @ R_x(phi).
+            from scipy.spatial.transform import Rotation
+            rots = Rotation.from_euler(
+                'ZYX',
+                np.stack([psis, thetas, phis], axis=1)
+            ).as_matrix()
+
+            x_cg_b, y_cg_b, z_cg_b = self.convert_axes(
+                self.mass_props.x_cg,
+                self.mass_props.y_cg,
+                self.mass_props.z_cg,
+                from_axes=cg_axes,
+                to_axes="body"
+            )
+            x_cg_b = np.broadcast_to(np.atleast_1d(np.array(x_cg_b)), (length,))
+            y_cg_b = np.broadcast_to(np.atleast_1d(np.array(y_cg_b)), (length,))
+            z_cg_b = np.broadcast_to(np.atleast_1d(np.array(z_cg_b)), (length,))
+
+            if draw_axes:
+                # The axes-marker length only depends on the overall size of the (scaled) vehicle mesh, so
+                # compute it once from the template rather than from each frame's transformed bounds.
+                axes_scale = 0.5 * np.max(
+                    np.diff(
+                        np.array(vehicle_model.bounds).reshape((3, -1)),
+                        axis=1
+                    )
+                ) * scale_vehicle_model
+                axes_segment_points = [[], [], []]  # Endpoint pairs of the x-, y-, and z-axis markers of all frames
+
+            # The per-frame vehicle meshes are aggregated into a single MultiBlock (and the axes markers below
+            # into one line-segment mesh per color), so that the plotter registers a constant number of actors
+            # regardless of `n_vehicles_to_draw`; VTK's rendering bookkeeping is per-actor.
+            vehicle_meshes = pv.MultiBlock()
+
             for i in np.unique(
                     np.round(
                         np.linspace(0, len(self) - 1, n_vehicles_to_draw)
                     )
             ).astype(np.int64):
-                dyn = self[i]
-                try:
-                    phi = dyn.phi
-                except AttributeError:
-                    phi = dyn.bank
-                try:
-                    theta = dyn.theta
-                except AttributeError:
-                    theta = dyn.gamma
-                try:
-                    psi = dyn.psi
-                except AttributeError:
-                    psi = dyn.track
-
-                x_cg_b, y_cg_b, z_cg_b = dyn.convert_axes(
-                    dyn.mass_props.x_cg,
-                    dyn.mass_props.y_cg,
-                    dyn.mass_props.z_cg,
-                    from_axes=cg_axes,
-                    to_axes="body"
+                rot = rots[i]
+
+                this_vehicle = vehicle_model.copy()
+                this_vehicle.points = (
+                        scale_vehicle_model * (
+                        base_points - np.array([[x_cg_b[i], y_cg_b[i], z_cg_b[i]]])
+                ) @ rot.T +
+                        np.array([[x_e[i], y_e[i], z_e[i]]])
                 )
+                vehicle_meshes.append(this_vehicle)
 
-                this_vehicle = copy.deepcopy(vehicle_model)
-                this_vehicle.translate([
-                    -x_cg_b,
-                    -y_cg_b,
-                    -z_cg_b,
-                ], inplace=True)
-                this_vehicle.points *= scale_vehicle_model
-                this_vehicle.rotate_x(np.degrees(phi), inplace=True)
-                this_vehicle.rotate_y(np.degrees(theta), inplace=True)
-                this_vehicle.rotate_z(np.degrees(psi), inplace=True)
-                this_vehicle.translate([
-                    dyn.x_e,
-                    dyn.y_e,
-                    dyn.z_e,
-                ], inplace=True)
-                plotter.add_mesh(
-                    this_vehicle,
-                )
                 if draw_axes:
-                    rot = np.rotation_matrix_from_euler_angles(phi, theta, psi)
-                    axes_scale = 0.5 * np.max(
-                        np.diff(
-                            np.array(this_vehicle.bounds).reshape((3, -1)),
-                            axis=1
-                        )
-                    )
                     origin = np.array([
-                        dyn.x_e,
-                        dyn.y_e,
-                        dyn.z_e,
+                        x_e[i],
+                        y_e[i],
+                        z_e[i],
                     ])
-                    for i, c in enumerate(["r", "g", "b"]):
-                        plotter.add_mesh(
-                            pv.Spline(np.array([
-                                origin,
-                                origin + rot[:, i] * axes_scale
-                            ])),
-                            color=c,
-                            line_width=2.5,
-                        )
-
-            for i in range(len(self)):
-                ### Draw the trajectory line
-
-                polyline = pv.Spline(np.array([x_e, y_e, z_e]).T)
-                plotter.add_mesh(
-                    polyline,
-                    color=p.adjust_lightness(p.palettes["categorical"][0], 1.2),
-                    line_width=3,
-                )
+                    for j in range(3):
+                        axes_segment_points[j] += [
+                            origin,
+                            origin + rot[:, j] * axes_scale,
+                        ]
+
+            plotter.add_mesh(
+                vehicle_meshes,
+            )
+            if draw_axes:
+                for j, c in enumerate(["r", "g", "b"]):
+                    plotter.add_mesh(
+                        pv.line_segments_from_points(np.stack(axes_segment_points[j])),
+                        color=c,
+                        line_width=2.5,
+                    )
+
+            ### Draw the trajectory line
+            polyline = pv.Spline(np.array([x_e, y_e, z_e]).T)
+            plotter.add_mesh(
+                polyline,
+                color=p.adjust_lightness(p.palettes["categorical"][0], 1.2),
+                line_width=3,
+            )
 
             ### Finalize the plotter
             plotter.camera.up = (0, 0, -1)
@@ -0,0 +1,75 @@
+import copy
+import pickle
+
+import aerosandbox as asb
+import aerosandbox.numpy as np
+import pytest
+
+
+def make_vectorized_dyn() -> asb.DynamicsPointMass3DCartesian:
+    return asb.DynamicsPointMass3DCartesian(
+        mass_props=asb.MassProperties(mass=1, x_cg=0.3),
+        x_e=np.linspace(0, 100, 11),
+        y_e=np.linspace(0, 10, 11),
+        z_e=np.linspace(0, -50, 11),
+        u_e=np.linspace(10, 20, 11),
+        v_e=1,
+        w_e=-5,
+        alpha=3,
+        beta=1,
+        bank=0.2,
+    )
+
+
+def assert_dyns_equal(dyn1, dyn2):
+    assert type(dyn1) is type(dyn2)
+    for key in dyn1.state.keys():
+        assert np.all(getattr(dyn1, key) == getattr(dyn2, key))
+    for key in dyn1.control_variables.keys():
+        assert np.all(getattr(dyn1, key) == getattr(dyn2, key))
+    assert dyn1.mass_props.mass == dyn2.mass_props.mass
+    assert dyn1.mass_props.x_cg == dyn2.mass_props.x_cg
+
+
+def test_copy():
+    dyn = make_vectorized_dyn()
+    assert_dyns_equal(dyn, copy.copy(dyn))
+
+
+def test_deepcopy():
+    dyn = make_vectorized_dyn()
+    dyn_copy = copy.deepcopy(dyn)
+    assert_dyns_equal(dyn, dyn_copy)
+
+    dyn_copy.x_e[0] = -1  # A deep copy should not share array storage with the original.
+    assert dyn.x_e[0] == 0
+
+
+def test_pickle_round_trip():
+    dyn = make_vectorized_dyn()
+    dyn_restored = pickle.loads(pickle.dumps(dyn))
+    assert_dyns_equal(dyn, dyn_restored)
+
+    # The restored instance should be fully functional, not just data-equal.
+    assert len(dyn_restored) == len(dyn)
+    assert dyn_restored[-1].x_e == dyn.x_e[-1]
+    assert dyn_restored.speed[0] == pytest.approx(dyn.speed[0])
+
+
+def test_rigid_body_pickle_round_trip():
+    dyn = asb.DynamicsRigidBody3DBodyEuler(
+        mass_props=asb.MassProperties(mass=1, Ixx=0.1, Iyy=0.2, Izz=0.3),
+        x_e=np.linspace(0, 100, 11),
+        u_b=np.linspace(10, 20, 11),
+        w_b=1,
+        theta=0.1,
+        q=0.05,
+    )
+    dyn_restored = pickle.loads(pickle.dumps(copy.deepcopy(dyn)))
+    for key in dyn.state.keys():
+        assert np.all(getattr(dyn, key) == getattr(dyn_restored, key))
+    assert dyn_restored.alpha[0] == pytest.approx(dyn.alpha[0])
+
+
+if __name__ == '__main__':
+    pytest.main()
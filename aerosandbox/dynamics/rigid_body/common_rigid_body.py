@@ -6,6 +6,16 @@ from aerosandbox import OperatingPoint, Atmosphere
 
 
 class _DynamicsRigidBodyBaseClass(_DynamicsPointMassBaseClass, ABC):
+    # The additional state and control variable names of the rigid-body Dynamics family, beyond those declared
+    # on _DynamicsPointMassBaseClass. See the note on `__slots__` there.
+    __slots__ = (
+        "u_b", "v_b", "w_b",
+        "phi", "theta", "psi",
+        "p", "q", "r",
+        "Fx_b", "Fy_b", "Fz_b",
+        "Mx_b", "My_b", "Mz_b",
+        "hx_b", "hy_b", "hz_b",
+    )
 
     # TODO: add method for force at offset (i.e., add moment and force)
 
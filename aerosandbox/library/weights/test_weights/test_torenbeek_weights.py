@@ -0,0 +1,163 @@
+import aerosandbox as asb
+import aerosandbox.numpy as np
+import pytest
+from aerosandbox.library.weights import torenbeek_weights as tw
+
+af = asb.Airfoil("naca2412")
+
+
+def make_wing(
+        span: float = 16,
+        root_chord: float = 2,
+        taper_ratio: float = 0.4,
+        le_sweep_x: float = 1,
+) -> asb.Wing:
+    return asb.Wing(
+        xsecs=[
+            asb.WingXSec(
+                xyz_le=[0, 0, 0],
+                chord=root_chord,
+                airfoil=af,
+                control_surfaces=[
+                    asb.ControlSurface(name="flap", hinge_point=0.75)
+                ],
+            ),
+            asb.WingXSec(
+                xyz_le=[le_sweep_x, span / 2, 0],
+                chord=root_chord * taper_ratio,
+                airfoil=af,
+            ),
+        ],
+        symmetric=True,
+    )
+
+
+wings = [
+    make_wing(span=16, root_chord=2, taper_ratio=0.4, le_sweep_x=1),
+    make_wing(span=30, root_chord=4, taper_ratio=0.3, le_sweep_x=3),
+    make_wing(span=8, root_chord=1.2, taper_ratio=0.8, le_sweep_x=0),
+]
+
+design_masses_TOGW = [8000, 50000, 1500]
+ultimate_load_factors = [3.75, 3.75, 5.7]
+suspended_masses = [6500, 40000, 1200]
+never_exceed_airspeeds = [150, 250, 80]
+max_airspeeds_for_flaps = [60, 100, 40]
+
+
+def test_mass_wing_batch_matches_mass_wing():
+    masses_looped = [
+        tw.mass_wing(
+            wing=wing,
+            design_mass_TOGW=design_mass_TOGW,
+            ultimate_load_factor=ultimate_load_factor,
+            suspended_mass=suspended_mass,
+            never_exceed_airspeed=never_exceed_airspeed,
+            max_airspeed_for_flaps=max_airspeed_for_flaps,
+        )
+        for wing, design_mass_TOGW, ultimate_load_factor, suspended_mass, never_exceed_airspeed, max_airspeed_for_flaps
+        in zip(wings, design_masses_TOGW, ultimate_load_factors, suspended_masses, never_exceed_airspeeds,
+               max_airspeeds_for_flaps)
+    ]
+
+    masses_batch = tw.mass_wing_batch(
+        span=np.array([wing.span() for wing in wings]),
+        sweep_half_chord=np.array([wing.mean_sweep_angle(x_nondim=0.5) for wing in wings]),
+        sweep_leading_edge=np.array([wing.mean_sweep_angle(x_nondim=0) for wing in wings]),
+        sweep_trailing_edge=np.array([wing.mean_sweep_angle(x_nondim=1) for wing in wings]),
+        taper_ratio=np.array([wing.taper_ratio() for wing in wings]),
+        root_t_over_c=np.array([wing.xsecs[0].airfoil.max_thickness() for wing in wings]),
+        S_flaps=np.array([wing.control_surface_area() for wing in wings]),
+        design_mass_TOGW=np.array(design_masses_TOGW),
+        ultimate_load_factor=np.array(ultimate_load_factors),
+        suspended_mass=np.array(suspended_masses),
+        never_exceed_airspeed=np.array(never_exceed_airspeeds),
+        max_airspeed_for_flaps=np.array(max_airspeeds_for_flaps),
+    )
+
+    assert masses_batch == pytest.approx(np.array(masses_looped), rel=1e-12)
+
+
+def test_mass_wing_batch_broadcasts_scalars():
+    wing = wings[0]
+
+    design_masses_TOGW = np.array([2000, 8000, 50000])
+
+    masses_batch = tw.mass_wing_batch(
+        span=wing.span(),
+        sweep_half_chord=wing.mean_sweep_angle(x_nondim=0.5),
+        sweep_leading_edge=wing.mean_sweep_angle(x_nondim=0),
+        sweep_trailing_edge=wing.mean_sweep_angle(x_nondim=1),
+        taper_ratio=wing.taper_ratio(),
+        root_t_over_c=wing.xsecs[0].airfoil.max_thickness(),
+        S_flaps=wing.control_surface_area(),
+        design_mass_TOGW=design_masses_TOGW,  # Only this argument is vectorized
+        ultimate_load_factor=3.75,
+        suspended_mass=6500,
+        never_exceed_airspeed=150,
+        max_airspeed_for_flaps=60,
+    )
+
+    assert masses_batch.shape == design_masses_TOGW.shape
+
+    masses_looped = [
+        tw.mass_wing(
+            wing=wing,
+            design_mass_TOGW=design_mass_TOGW,
+            ultimate_load_factor=3.75,
+            suspended_mass=6500,
+            never_exceed_airspeed=150,
+            max_airspeed_for_flaps=60,
+        )
+        for design_mass_TOGW in design_masses_TOGW
+    ]
+
+    assert masses_batch == pytest.approx(np.array(masses_looped), rel=1e-12)
+
+
+def test_mass_wing_simple_k_w_threshold():
+    wing = wings[0]
+
+    def mass_at(design_mass_TOGW):
+        return tw.mass_wing_simple(
+            wing=wing,
+            design_mass_TOGW=design_mass_TOGW,
+            ultimate_load_factor=3.75,
+            suspended_mass=6500,
+        )
+
+    mass_light = mass_at(5000)
+    mass_heavy = mass_at(6000)
+
+    # design_mass_TOGW enters the simple model only through k_w, so on the numeric path this ratio pins both
+    # the hard threshold and the coefficient orientation: > 5670 kg -> 6.67e-3, otherwise 4.90e-3.
+    assert mass_heavy / mass_light == pytest.approx(6.67e-3 / 4.90e-3, rel=1e-12)
+
+    # The threshold is exclusive: exactly 5670 kg takes the light-aircraft coefficient.
+    assert mass_at(5670) == pytest.approx(mass_light, rel=1e-12)
+
+    # Array inputs broadcast across the threshold.
+    assert mass_at(np.array([5000, 6000])) == pytest.approx(np.array([mass_light, mass_heavy]), rel=1e-12)
+
+
+def test_mass_wing_simple_casadi_path_blends():
+    import casadi as cas
+
+    wing = wings[0]
+
+    def mass_at(design_mass_TOGW):
+        return tw.mass_wing_simple(
+            wing=wing,
+            design_mass_TOGW=design_mass_TOGW,
+            ultimate_load_factor=3.75,
+            suspended_mass=6500,
+        )
+
+    # On the symbolic path, k_w must still use np.blend for C1-continuity, rather than the hard threshold:
+    # at exactly 5670 kg, the blend sits at the mean of the two coefficients.
+    mass_sym = float(cas.evalf(mass_at(cas.MX(5670))))
+    assert mass_sym == pytest.approx((mass_at(5000) + mass_at(6000)) / 2, rel=1e-9)
+
+
+if __name__ == '__main__':
+    pytest.main()
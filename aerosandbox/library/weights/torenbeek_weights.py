@@ -2,11 +2,52 @@ import aerosandbox as asb
 import aerosandbox.numpy as np
 import aerosandbox.tools.units as u
 from typing import Dict, Union
+import functools
 
 
 # From Torenbeek: "Synthesis of Subsonic Airplane Design", 1976, Delft University Press
 # Chapter 8: "Airplane Weight and Balance"
 
+def _mass_wing_simple_core(
+        span_structural: float,
+        wing_root_thickness: float,
+        wing_area: float,
+        design_mass_TOGW: float,
+        ultimate_load_factor: float,
+        suspended_mass: float,
+        main_gear_mounted_to_wing: bool = True,
+) -> float:
+    """
+    The closed-form math of `mass_wing_simple()`, operating on pre-extracted wing geometry scalars rather than a
+    Wing object. Inputs broadcast, so this can be evaluated over whole design sweeps in a single call.
+    """
+    if np.is_casadi_type(design_mass_TOGW, recursive=False):
+        # Blend between the light- and heavy-aircraft coefficients, to keep the model C1-continuous (and hence
+        # optimizer-friendly) across the 5670 kg boundary.
+        k_w = np.blend(
+            (design_mass_TOGW - 5670) / 2000,
+            6.67e-3,
+            4.90e-3
+        )
+    else:
+        # On the numeric path, use Torenbeek's hard threshold directly; this skips the sigmoid (an exp per
+        # call) and matches the book exactly away from the boundary.
+        k_w = np.where(
+            design_mass_TOGW > 5670,
+            6.67e-3,
+            4.90e-3
+        )
+
+    return suspended_mass * (
+            k_w *
+            span_structural ** 0.75 *
+            (1 + (1.905 / span_structural) ** 0.5) *
+            ultimate_load_factor ** 0.55 *
+            ((span_structural / wing_root_thickness) / (suspended_mass / wing_area)) ** 0.30 *
+            (1 if main_gear_mounted_to_wing else 0.95)
+    )
+
+
 def mass_wing_simple(
         wing: asb.Wing,
         design_mass_TOGW: float,
@@ -41,25 +82,77 @@ def mass_wing_simple(
 
     """
 
-    k_w = np.blend(
-        (design_mass_TOGW - 5670) / 2000,
-        6.67e-3,
-        4.90e-3
-    )
+    # Sweep at 50% chord
+    sweep_half_chord = wing.mean_sweep_angle(x_nondim=0.5)
+    cos_sweep_half_chord = np.cosd(sweep_half_chord)
 
-    span = wing.span() / np.cosd(wing.mean_sweep_angle(x_nondim=0.5))
+    # span_structural is the "structural" wing span, which takes into account the wing's sweep angle.
+    span_structural = wing.span() / cos_sweep_half_chord
 
     wing_root_thickness = wing.xsecs[0].airfoil.max_thickness() * wing.xsecs[0].chord
 
-    return suspended_mass * (
-            k_w *
-            span ** 0.75 *
-            (1 + (1.905 / span) ** 0.5) *
-            ultimate_load_factor ** 0.55 *
-            ((span / wing_root_thickness) / (suspended_mass / wing.area())) ** 0.30 *
-            (1 if main_gear_mounted_to_wing else 0.95)
+    return _mass_wing_simple_core(
+        span_structural=span_structural,
+        wing_root_thickness=wing_root_thickness,
+        wing_area=wing.area(),
+        design_mass_TOGW=design_mass_TOGW,
+        ultimate_load_factor=ultimate_load_factor,
+        suspended_mass=suspended_mass,
+        main_gear_mounted_to_wing=main_gear_mounted_to_wing,
+    )
+
+
+def _mass_wing_high_lift_devices_core(
+        S_flaps: float,
+        span_structural: float,
+        root_t_over_c: float,
+        cos_sweep_trailing_edge: float,
+        max_airspeed_for_flaps: float,
+        flap_deflection_angle: float = 30,
+        k_f1: float = 1.0,
+        k_f2: float = 1.0,
+) -> float:
+    """
+    The closed-form math of `mass_wing_high_lift_devices()`, operating on pre-extracted wing geometry scalars
+    rather than a Wing object. Inputs broadcast, so this can be evaluated over whole design sweeps in a single call.
+    """
+    # Torenbeek Eq. C-10
+    k_f = k_f1 * k_f2
+
+    # The two fractionally-powered factors of Eq. C-10, written here as bases to be exponentiated jointly below.
+    flap_geometry_factor = S_flaps * span_structural  # Carries exponent 3/16
+    flap_loading_factor = (  # Carries exponent 3/4
+            (max_airspeed_for_flaps / 100) ** 2 *
+            np.sind(flap_deflection_angle) *
+            cos_sweep_trailing_edge /
+            root_t_over_c
+    )
+
+    # Guard the log against S_flaps == 0 (an ordinary input: any wing without flaps). The leading S_flaps
+    # factor already zeroes the flap mass there, so the substituted base of 1 is never observed in the result;
+    # without it, np.log would emit divide-by-zero warnings across a design sweep.
+    flap_geometry_factor = np.where(
+        flap_geometry_factor > 0,
+        flap_geometry_factor,
+        1
+    )
+
+    # The two fractional powers are evaluated as exp(sum(a_i * log(x_i))), which replaces two `pow` calls with
+    # two logs and one exp.
+    mass_trailing_edge_flaps = S_flaps * (
+            2.706 * k_f *
+            np.exp(
+                (3 / 16) * np.log(flap_geometry_factor) +
+                (3 / 4) * np.log(flap_loading_factor)
+            )
     )
 
+    mass_leading_edge_devices = 0
+
+    mass_high_lift_devices = mass_trailing_edge_flaps + mass_leading_edge_devices
+
+    return mass_high_lift_devices
+
 
 def mass_wing_high_lift_devices(
         wing: asb.Wing,
@@ -110,25 +203,98 @@ def mass_wing_high_lift_devices(
     # Airfoil thickness over chord ratio at root
     root_t_over_c = wing.xsecs[0].airfoil.max_thickness()
 
-    # Torenbeek Eq. C-10
-    k_f = k_f1 * k_f2
+    # Sweep at the trailing edge
+    sweep_trailing_edge = wing.mean_sweep_angle(x_nondim=1)
+    cos_sweep_trailing_edge = np.cosd(sweep_trailing_edge)
 
-    mass_trailing_edge_flaps = S_flaps * (
-            2.706 * k_f *
-            (S_flaps * span_structural) ** (3 / 16) *
-            (
-                    (max_airspeed_for_flaps / 100) ** 2 *
-                    np.sind(flap_deflection_angle) *
-                    np.cosd(wing.mean_sweep_angle(x_nondim=1)) /
-                    root_t_over_c
-            ) ** (3 / 4)
+    return _mass_wing_high_lift_devices_core(
+        S_flaps=S_flaps,
+        span_structural=span_structural,
+        root_t_over_c=root_t_over_c,
+        cos_sweep_trailing_edge=cos_sweep_trailing_edge,
+        max_airspeed_for_flaps=max_airspeed_for_flaps,
+        flap_deflection_angle=flap_deflection_angle,
+        k_f1=k_f1,
+        k_f2=k_f2,
     )
 
-    mass_leading_edge_devices = 0
 
-    mass_high_lift_devices = mass_trailing_edge_flaps + mass_leading_edge_devices
+def _mass_wing_basic_structure_core(
+        span: float,
+        cos_sweep_half_chord: float,
+        cos_sweep_leading_edge: float,
+        taper_ratio: float,
+        root_t_over_c: float,
+        design_mass_TOGW: float,
+        ultimate_load_factor: float,
+        suspended_mass: float,
+        never_exceed_airspeed: float,
+        main_gear_mounted_to_wing: bool = True,
+        strut_y_location: float = None,
+        k_e: float = 0.95,
+        return_dict: bool = False,
+) -> Union[float, Dict[str, float]]:
+    """
+    The closed-form math of `mass_wing_basic_structure()`, operating on pre-extracted wing geometry scalars
+    rather than a Wing object. Inputs broadcast, so this can be evaluated over whole design sweeps in a single call.
+    """
+    # Structural wing span
+    span_structural = span / cos_sweep_half_chord
 
-    return mass_high_lift_devices
+    # Torenbeek Eq. C-2
+    # `k_no` represents penalties due to skin joints, non-tapered skin, minimum gauge, etc.
+    k_no = 1 + (1.905 / span_structural) ** 0.5
+
+    # Torenbeek Eq. C-3
+    # `k_lambda` represents penalties due to taper ratio
+    k_lambda = (1 + taper_ratio) ** 0.4
+
+    # `k_uc` represents weight knockdowns due to undercarriage.
+    k_uc = 1 if main_gear_mounted_to_wing else 0.95
+
+    # Torenbeek Eq. C-4
+    # `k_st` represents weight excrescence due to structural stiffness against flutter.
+    k_st = (
+            1 +
+            9.06e-4 * (
+                    (span * cos_sweep_leading_edge) ** 3 /
+                    design_mass_TOGW
+            ) * (
+                    never_exceed_airspeed / 100 / root_t_over_c
+            ) ** 2 *
+            cos_sweep_half_chord
+    )
+
+    # Torenbeek Eq. C-5
+    # `k_b` represents weight knockdowns due to bending moment relief from strut location.
+    if strut_y_location is None:
+        k_b = 1
+    else:
+        k_b = 1 - (strut_y_location / (span / 2)) ** 2
+
+    ### Use all the above to compute the basic wing structural mass
+    # The chain of fractional powers is evaluated as exp(sum(a_i * log(x_i))), which replaces four `pow` calls
+    # with three logs and one exp. (All arguments are positive reals.) For CasADi symbolics, this also halves
+    # the number of nonlinear nodes in the resulting expression graph.
+    mass_wing_basic = (
+            4.58e-3 *
+            k_no *
+            k_lambda *
+            k_e *
+            k_uc *
+            k_st *
+            np.exp(
+                0.55 * np.log(k_b * ultimate_load_factor * (0.8 * suspended_mass + 0.2 * design_mass_TOGW)) +
+                1.675 * np.log(span) -
+                0.45 * np.log(root_t_over_c) -
+                1.325 * np.log(cos_sweep_half_chord)
+            )
+    )
+
+    if return_dict:
+        return locals()
+    else:
+        return mass_wing_basic
 
 
 def mass_wing_basic_structure(
@@ -189,63 +355,36 @@ def mass_wing_basic_structure(
     sweep_half_chord = wing.mean_sweep_angle(x_nondim=0.5)
     cos_sweep_half_chord = np.cosd(sweep_half_chord)
 
-    # Structural wing span
-    span_structural = span / cos_sweep_half_chord
+    # Sweep at the leading edge
+    sweep_leading_edge = wing.mean_sweep_angle(x_nondim=0)
+    cos_sweep_leading_edge = np.cosd(sweep_leading_edge)
 
     # Airfoil thickness over chord ratio at root
     root_t_over_c = wing.xsecs[0].airfoil.max_thickness()
 
-    # Torenbeek Eq. C-2
-    # `k_no` represents penalties due to skin joints, non-tapered skin, minimum gauge, etc.
-    k_no = 1 + (1.905 / span_structural) ** 0.5
-
-    # Torenbeek Eq. C-3
-    # `k_lambda` represents penalties due to taper ratio
-    k_lambda = (1 + wing.taper_ratio()) ** 0.4
-
-    # `k_uc` represents weight knockdowns due to undercarriage.
-    k_uc = 1 if main_gear_mounted_to_wing else 0.95
-
-    # Torenbeek Eq. C-4
-    # `k_st` represents weight excrescence due to structural stiffness against flutter.
-    k_st = (
-            1 +
-            9.06e-4 * (
-                    (span * np.cosd(wing.mean_sweep_angle(x_nondim=0))) ** 3 /
-                    design_mass_TOGW
-            ) * (
-                    never_exceed_airspeed / 100 / root_t_over_c
-            ) ** 2 *
-            cos_sweep_half_chord
-    )
-
-    # Torenbeek Eq. C-5
-    # `k_b` represents weight knockdowns due to bending moment relief from strut location.
-    if strut_y_location is None:
-        k_b = 1
-    else:
-        k_b = 1 - (strut_y_location / (wing.span() / 2)) ** 2
-
-    ### Use all the above to compute the basic wing structural mass
-    mass_wing_basic = (
-            4.58e-3 *
-            k_no *
-            k_lambda *
-            k_e *
-            k_uc *
-            k_st *
-            (
-                    k_b * ultimate_load_factor * (0.8 * suspended_mass + 0.2 * design_mass_TOGW)
-            ) ** 0.55 *
-            span ** 1.675 *
-            root_t_over_c ** -0.45 *
-            cos_sweep_half_chord ** -1.325
+    core_outputs = _mass_wing_basic_structure_core(
+        span=span,
+        cos_sweep_half_chord=cos_sweep_half_chord,
+        cos_sweep_leading_edge=cos_sweep_leading_edge,
+        taper_ratio=wing.taper_ratio(),
+        root_t_over_c=root_t_over_c,
+        design_mass_TOGW=design_mass_TOGW,
+        ultimate_load_factor=ultimate_load_factor,
+        suspended_mass=suspended_mass,
+        never_exceed_airspeed=never_exceed_airspeed,
+        main_gear_mounted_to_wing=main_gear_mounted_to_wing,
+        strut_y_location=strut_y_location,
+        k_e=k_e,
+        return_dict=return_dict,
     )
 
     if return_dict:
-        return locals()
+        return {
+            **{k: v for k, v in locals().items() if k != "core_outputs"},
+            **core_outputs,
+        }
     else:
-        return mass_wing_basic
+        return core_outputs
 
 
 def mass_wing_spoilers_and_speedbrakes(
@@ -329,15 +468,38 @@ def mass_wing(
 
     """
 
+    # Extract the wing geometry once, so that the quantities shared between the sub-models below (notably the
+    # sweep cosines, which each cost a deg-to-rad conversion and a cosine per evaluation) are only computed once.
+
+    # Wing span
+    span = wing.span()
+
+    # Sweep at 50% chord
+    sweep_half_chord = wing.mean_sweep_angle(x_nondim=0.5)
+    cos_sweep_half_chord = np.cosd(sweep_half_chord)
+
+    # span_structural is the "structural" wing span, which takes into account the wing's sweep angle.
+    span_structural = span / cos_sweep_half_chord
+
+    # Airfoil thickness over chord ratio at root
+    root_t_over_c = wing.xsecs[0].airfoil.max_thickness()
+
     # High-lift mass estimation
-    mass_high_lift_devices = mass_wing_high_lift_devices(
-        wing=wing,
+    mass_high_lift_devices = _mass_wing_high_lift_devices_core(
+        S_flaps=wing.control_surface_area(),
+        span_structural=span_structural,
+        root_t_over_c=root_t_over_c,
+        cos_sweep_trailing_edge=np.cosd(wing.mean_sweep_angle(x_nondim=1)),
         max_airspeed_for_flaps=max_airspeed_for_flaps,
         flap_deflection_angle=flap_deflection_angle,
     )
     # Basic wing structure mass estimation
-    mass_basic_wing = mass_wing_basic_structure(
-        wing=wing,
+    mass_basic_wing = _mass_wing_basic_structure_core(
+        span=span,
+        cos_sweep_half_chord=cos_sweep_half_chord,
+        cos_sweep_leading_edge=np.cosd(wing.mean_sweep_angle(x_nondim=0)),
+        taper_ratio=wing.taper_ratio(),
+        root_t_over_c=root_t_over_c,
         design_mass_TOGW=design_mass_TOGW,
         ultimate_load_factor=ultimate_load_factor,
         suspended_mass=suspended_mass,
@@ -362,6 +524,101 @@ def mass_wing(
         return mass_wing_total
 
 
+def mass_wing_batch(
+        span: Union[float, np.ndarray],
+        sweep_half_chord: Union[float, np.ndarray],
+        sweep_leading_edge: Union[float, np.ndarray],
+        sweep_trailing_edge: Union[float, np.ndarray],
+        taper_ratio: Union[float, np.ndarray],
+        root_t_over_c: Union[float, np.ndarray],
+        S_flaps: Union[float, np.ndarray],
+        design_mass_TOGW: Union[float, np.ndarray],
+        ultimate_load_factor: Union[float, np.ndarray],
+        suspended_mass: Union[float, np.ndarray],
+        never_exceed_airspeed: Union[float, np.ndarray],
+        max_airspeed_for_flaps: Union[float, np.ndarray],
+        main_gear_mounted_to_wing: bool = True,
+        flap_deflection_angle: float = 30,
+        strut_y_location: Union[float, np.ndarray] = None,
+) -> Union[float, np.ndarray]:
+    """
+    Vectorized equivalent of `mass_wing()`, operating on arrays of pre-extracted wing geometry scalars rather
+    than Wing objects.
+
+    All arguments broadcast against each other, so a whole design sweep (e.g., 10,000 candidate wings) evaluates
+    in a single NumPy pass, rather than a Python loop over `mass_wing()` calls.
+
+    Args:
+
+        span: Wing span of each candidate wing [m]. As `Wing.span()`.
+
+        sweep_half_chord: Mean sweep angle at 50% chord [deg]. As `Wing.mean_sweep_angle(x_nondim=0.5)`.
+
+        sweep_leading_edge: Mean sweep angle at the leading edge [deg]. As `Wing.mean_sweep_angle(x_nondim=0)`.
+
+        sweep_trailing_edge: Mean sweep angle at the trailing edge [deg]. As `Wing.mean_sweep_angle(x_nondim=1)`.
+
+        taper_ratio: Wing taper ratio [-]. As `Wing.taper_ratio()`.
+
+        root_t_over_c: Airfoil thickness-over-chord ratio at the wing root [-].
+
+        S_flaps: Total flapped (control surface) area [m^2]. As `Wing.control_surface_area()`.
+
+        design_mass_TOGW: The design takeoff gross weight of the entire aircraft [kg].
+
+        ultimate_load_factor: The ultimate load factor of the aircraft. 1.5x the limit load factor.
+
+        suspended_mass: The mass of the aircraft that is suspended from the wing [kg].
+
+        never_exceed_airspeed: The never-exceed airspeed of the aircraft [m/s]. Used for flutter calculations.
+
+        max_airspeed_for_flaps: The maximum airspeed at which the flaps are allowed to be deployed [m/s].
+
+        main_gear_mounted_to_wing: Whether the main gear is mounted to the wing structure.
+
+        flap_deflection_angle: The maximum deflection angle of the flaps [deg].
+
+        strut_y_location: The spanwise location of the strut (if any), as measured from the wing root [m]. If
+            None, the wing is assumed to be a cantilever beam.
+
+    Returns: The total mass of each candidate wing [kg], broadcast over the inputs.
+
+    """
+    cos_sweep_half_chord = np.cosd(sweep_half_chord)
+    span_structural = span / cos_sweep_half_chord
+
+    # High-lift mass estimation
+    mass_high_lift_devices = _mass_wing_high_lift_devices_core(
+        S_flaps=S_flaps,
+        span_structural=span_structural,
+        root_t_over_c=root_t_over_c,
+        cos_sweep_trailing_edge=np.cosd(sweep_trailing_edge),
+        max_airspeed_for_flaps=max_airspeed_for_flaps,
+        flap_deflection_angle=flap_deflection_angle,
+    )
+    # Basic wing structure mass estimation
+    mass_basic_wing = _mass_wing_basic_structure_core(
+        span=span,
+        cos_sweep_half_chord=cos_sweep_half_chord,
+        cos_sweep_leading_edge=np.cosd(sweep_leading_edge),
+        taper_ratio=taper_ratio,
+        root_t_over_c=root_t_over_c,
+        design_mass_TOGW=design_mass_TOGW,
+        ultimate_load_factor=ultimate_load_factor,
+        suspended_mass=suspended_mass,
+        never_exceed_airspeed=never_exceed_airspeed,
+        main_gear_mounted_to_wing=main_gear_mounted_to_wing,
+        strut_y_location=strut_y_location,
+    )
+    # Spoilers and speedbrake mass estimation, as in mass_wing_spoilers_and_speedbrakes()
+    mass_spoilers_speedbrakes = 0.015 * mass_basic_wing
+
+    return (
+            mass_basic_wing +
+            1.2 * (mass_high_lift_devices + mass_spoilers_speedbrakes)
+    )
+
+
 # def mass_hstab(
 #         hstab: asb.Wing,
 #         design_mass_TOGW: float,
@@ -372,6 +629,21 @@ def mass_wing(
 #
 #     k_wt = 0.64
 
+def _softmax_or_max(
+        *args: float,
+        softness: float,
+) -> float:
+    """
+    Takes the maximum of the given values: smoothly (np.softmax) if any input is a CasADi symbolic, where a
+    C1-continuous max is needed for gradient-based optimization, and exactly (np.maximum) on the numeric path,
+    where smoothness buys nothing and the softmax's exp/log calls are wasted work. np.maximum (rather than
+    Python's max) keeps NumPy-array inputs broadcasting, for vectorized design sweeps.
+    """
+    if any(np.is_casadi_type(arg, recursive=False) for arg in args):
+        return np.softmax(*args, softness=softness)
+    return functools.reduce(np.maximum, args)
+
+
 def mass_fuselage_simple(
         fuselage: asb.Fuselage,
         never_exceed_airspeed: float,
@@ -403,7 +675,7 @@ def mass_fuselage_simple(
         for xsec in fuselage.xsecs
     ]
 
-    max_width = np.softmax(
+    max_width = _softmax_or_max(
         *widths,
         softness=np.mean(np.array(widths)) * 0.01
     )
@@ -413,7 +685,7 @@ def mass_fuselage_simple(
         for xsec in fuselage.xsecs
     ]
 
-    max_height = np.softmax(
+    max_height = _softmax_or_max(
         *heights,
         softness=np.mean(np.array(heights)) * 0.01
     )
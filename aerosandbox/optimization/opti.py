@@ -4,9 +4,29 @@ import casadi as cas
 import aerosandbox.numpy as np
 from aerosandbox.tools import inspect_tools
 from sortedcontainers import SortedDict
+from types import MemberDescriptorType
 import copy
 
 
+def _get_attribute_items(x) -> Dict[str, Any]:
+    """
+    Returns a name-to-value dict of all attributes bound on the object `x`, including any stored in `__slots__`
+    (which do not appear in `x.__dict__`). Slot names shadowed by class-level properties are excluded, matching
+    plain `__dict__` iteration on a slot-less class.
+    """
+    items = {}
+    for cls in type(x).__mro__:
+        for name in cls.__dict__.get("__slots__", ()):
+            descriptor = getattr(type(x), name, None)
+            if isinstance(descriptor, MemberDescriptorType):
+                try:
+                    items[name] = descriptor.__get__(x)
+                except AttributeError:  # Slot was declared, but never assigned on this instance.
+                    pass
+    items.update(x.__dict__)
+    return items
+
+
 class Opti(cas.Opti):
     """
     The base class for mathematical optimization. For detailed usage, see the docstrings in its key methods:
@@ -1331,11 +1351,11 @@ class OptiSol:
         )):
             return x
 
-        # If it's any other type, try converting its attribute dictionary, if it has one:
+        # If it's any other type, try converting its attributes (including any stored in __slots__), if it has any:
         try:
             new_x = copy.copy(x)
 
-            for k, v in x.__dict__.items():
+            for k, v in _get_attribute_items(x).items():
                 setattr(new_x, k, self.value(v))
 
             return new_x